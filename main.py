@@ -2,7 +2,6 @@
 
 import sys
 import os
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 
 import sys
-import os
-from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow)
 
 def main():